@@ -10,11 +10,228 @@ Data Sources:
 - US: Federal Reserve Survey of Consumer Finances
 """
 
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import requests
-from typing import Dict
+import concurrent.futures
+import functools
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, NamedTuple, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import requests
+
+# pandas, matplotlib, numba and requests are imported on first use to keep startup fast
+
+# Current BTC price is cached on disk so repeat runs skip the network
+_PRICE_URL = 'https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd'
+_PRICE_CACHE_PATH = Path.home() / '.cache' / 'btc_calc_price.json'
+_PRICE_TTL = 300  # seconds
+
+@functools.lru_cache(maxsize=1)
+def _read_price_cache() -> Optional[Dict]:
+    """Load the on-disk price cache, memoized for the lifetime of the process"""
+    try:
+        with open(_PRICE_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _http_session() -> "requests.Session":
+    """Shared keep-alive session so repeated price fetches reuse the connection"""
+    import requests
+    
+    return requests.Session()
+
+def _write_price_cache(price: float):
+    """Store a freshly fetched price on disk"""
+    tmp_path = None
+    try:
+        _PRICE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write a sibling temp file and rename it over the cache so concurrent
+        # runs never see (or produce) a half-written file
+        with tempfile.NamedTemporaryFile('w', dir=_PRICE_CACHE_PATH.parent,
+                                         suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            json.dump({'ts': time.time(), 'usd': price}, f)
+        os.replace(tmp_path, _PRICE_CACHE_PATH)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    _read_price_cache.cache_clear()
+
+# Characters ignored when parsing a net worth, e.g. "$1,000,000" or "1_000 000"
+_STRIP = str.maketrans('', '', '$, _')
+
+# Decimal places used by format_percentage, indexed by order of magnitude
+_PCT_FORMATS = ("{:.3f}%", "{:.4f}%", "{:.5f}%", "{:.6f}%", "{:.7f}%", "{:.8f}%")
+_PCT_THRESHOLDS = (1, 0.1, 0.01, 0.001, 0.0001, -math.inf)
+
+@functools.lru_cache(maxsize=2048)
+def _format_percentage(pct: float) -> str:
+    """Format percentage with appropriate decimal places"""
+    if pct >= 1:
+        k = 0
+    elif pct > 0:
+        # One extra decimal per order of magnitude below 1%
+        k = min(-math.floor(math.log10(pct)), 5)
+        if pct < _PCT_THRESHOLDS[k]:  # log10 rounds up just below a power of ten
+            k += 1
+    else:
+        k = 5
+    return _PCT_FORMATS[k].format(pct)
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    """Mark an array read-only so shared lookup tables cannot be modified"""
+    arr.setflags(write=False)
+    return arr
+
+def _dict_to_sorted_arrays(d: Mapping) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a percentile -> value dict into read-only arrays sorted by percentile"""
+    keys = sorted(d)
+    return (
+        _frozen(np.fromiter(keys, dtype=np.float64, count=len(keys))),
+        _frozen(np.fromiter((d[k] for k in keys), dtype=np.float64, count=len(keys)))
+    )
+
+# Wealth distribution data: percentile -> net worth (USD)
+_GLOBAL_PERCENTILES = MappingProxyType({  # UBS Global Wealth Report 2024
+    0: -5000, 10: 1500, 20: 3500, 30: 6000, 39.5: 10000, 50: 25000,
+    60: 40000, 70: 60000, 80: 85000, 82.2: 100000, 90: 200000,
+    95: 500000, 98.5: 1000000, 99: 1500000, 99.5: 5000000,
+    99.9: 25000000, 100: 100000000
+})
+
+_US_PERCENTILES = MappingProxyType({  # Federal Reserve SCF
+    0: -10000, 10: 0, 25: 15000, 50: 121000, 75: 403000,
+    90: 1200000, 95: 2400000, 99: 11100000, 99.5: 21000000,
+    99.9: 43200000, 100: 500000000
+})
+
+# Sorted interpolation arrays shared by every calculator instance
+_GLOBAL_ARRAYS = _dict_to_sorted_arrays(_GLOBAL_PERCENTILES)
+_US_ARRAYS = _dict_to_sorted_arrays(_US_PERCENTILES)
+
+# Standardized percentiles shown by the 'table' command
+_TABLE_PERCENTILES = _frozen(np.array([1, 5, 10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 99, 99.9]))
+_TABLE_LABELS = tuple(f"{pct:g}%" for pct in _TABLE_PERCENTILES)
+
+# Percentile axis swept by the 'plot' command
+_PLOT_PERCENTILES = _frozen(np.linspace(1, 99.9, 50))
+
+def _lerp_kernel(x: float, xp: np.ndarray, fp: np.ndarray) -> float:
+    """Clamped linear interpolation of a single point, rounded exactly like np.interp"""
+    n = xp.shape[0]
+    if np.isnan(x):
+        return x
+    if x <= xp[0]:
+        return fp[0]
+    if x >= xp[n - 1]:
+        return fp[n - 1]
+    i = np.searchsorted(xp, x, side='right') - 1
+    if xp[i] == x:
+        return fp[i]
+    # Same operation order as np.interp so both paths agree bit for bit
+    slope = (fp[i + 1] - fp[i]) / (xp[i + 1] - xp[i])
+    y = slope * (x - xp[i]) + fp[i]
+    if np.isnan(y):
+        y = slope * (x - xp[i + 1]) + fp[i + 1]
+        if np.isnan(y) and fp[i] == fp[i + 1]:
+            y = fp[i]
+    return y
+
+def _interp_point(x: float, xp: np.ndarray, fp: np.ndarray) -> float:
+    """Clamped linear interpolation of a single net-worth query via np.interp"""
+    return float(np.interp(x, xp, fp))
+
+def _interp_kernel(q: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """Clamped linear interpolation of each query point"""
+    out = np.empty(q.shape[0])
+    for k in range(q.shape[0]):
+        out[k] = _lerp_kernel(q[k], xp, fp)
+    return out
+
+def _convert_numpy(q: np.ndarray, xp: np.ndarray, fp: np.ndarray,
+                   btc_price: float, btc_supply: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Interpolate net worths at percentiles q and convert to BTC and % of supply
+    
+    The table and plot only need a few dozen points, far fewer than it takes
+    for importing numba and loading a kernel to pay off.
+    """
+    wealths = np.interp(q, xp, fp)
+    bitcoin = wealths / btc_price
+    return wealths, bitcoin, bitcoin / btc_supply * 100
+
+@functools.lru_cache(maxsize=None)
+def _jit_or(kernel, fallback):
+    """Return kernel JIT-compiled with numba, or fallback when numba is not installed"""
+    try:
+        from numba import njit
+        from numba.extending import register_jitable
+    except ImportError:
+        return fallback
+    # _interp_kernel calls _lerp_kernel directly, so compiled code must be able to as well
+    register_jitable(_lerp_kernel)
+    return njit(cache=True)(kernel)
+
+class BitcoinResult(NamedTuple):
+    """Bitcoin needed to hold a net worth's percentile (arrays for batch queries)"""
+    net_worth: Union[float, np.ndarray]
+    percentile: Union[float, np.ndarray]
+    bitcoin_needed: Union[float, np.ndarray]
+    wealth_fraction: Union[float, np.ndarray]
+    supply_percentage: Union[float, np.ndarray]
+    wealth_base: float
+    btc_supply: float
+    data_source: str
+
+class _ModeState(NamedTuple):
+    """Mode-dependent data, swapped as a unit when switching distributions"""
+    pcts: np.ndarray
+    vals: np.ndarray
+    btc_price: float
+    wealth_base: float
+    btc_supply: float
+    inv_btc_price: float     # 1 / btc_price
+    wealth_pct_scale: float  # 100 / wealth_base
+    supply_pct_scale: float  # 100 / btc_supply
+    data_source: str
+    source: str
+    supply_label: str
+    
+    # Compared by identity so a state can key a cache; its arrays are unhashable
+    __hash__ = object.__hash__
+    
+    def __eq__(self, other) -> bool:
+        return self is other
+    
+    def __ne__(self, other) -> bool:
+        return self is not other
+
+def _calculate(net_worth: float, s: _ModeState) -> BitcoinResult:
+    """Uncached body of calculate_bitcoin_needed for one mode state"""
+    bitcoin_needed = net_worth * s.inv_btc_price
+    
+    return BitcoinResult(
+        net_worth=net_worth,
+        percentile=_interp_point(net_worth, s.vals, s.pcts),
+        bitcoin_needed=bitcoin_needed,
+        wealth_fraction=net_worth * s.wealth_pct_scale,
+        supply_percentage=bitcoin_needed * s.supply_pct_scale,
+        wealth_base=s.wealth_base,
+        btc_supply=s.btc_supply,
+        data_source=s.data_source
+    )
 
 class BitcoinWealthCalculator:
     def __init__(self):
@@ -34,38 +251,139 @@ class BitcoinWealthCalculator:
         self.btc_price_global = self.global_wealth / self.bitcoin_supply
         self.btc_price_us = self.us_wealth / self.us_bitcoin_share
         
-        # Wealth distribution data
-        self.global_percentiles = {
-            0: -5000, 10: 1500, 20: 3500, 30: 6000, 39.5: 10000, 50: 25000,
-            60: 40000, 70: 60000, 80: 85000, 82.2: 100000, 90: 200000,
-            95: 500000, 98.5: 1000000, 99: 1500000, 99.5: 5000000,
-            99.9: 25000000, 100: 100000000
-        }
+        # Wealth distribution data (shared, read-only)
+        self.global_percentiles = _GLOBAL_PERCENTILES
+        self.us_percentiles = _US_PERCENTILES
         
-        self.us_percentiles = {
-            0: -10000, 10: 0, 25: 15000, 50: 121000, 75: 403000,
-            90: 1200000, 95: 2400000, 99: 11100000, 99.5: 21000000,
-            99.9: 43200000, 100: 500000000
-        }
+        # Mode state (interpolation arrays, price, wealth base and supply)
+        self._global_state = self._build_state(
+            _GLOBAL_ARRAYS, self.btc_price_global,
+            self.global_wealth, self.bitcoin_supply, 'Global (UBS 2024)',
+            'Global', '% of Total Supply (21M)'
+        )
+        self._us_state = self._build_state(
+            _US_ARRAYS, self.btc_price_us,
+            self.us_wealth, self.us_bitcoin_share, 'US (Fed SCF)',
+            'US', '% of US Allocation (6.3M)'
+        )
+        
+        # Banners built from the constants above, rendered once
+        self._header_txt = (
+            "=== Bitcoin World Wealth Percentile Calculator ===\n\n"
+            f"Global: {self.global_adults/1e9:.1f}B adults, ${self.global_wealth/1e12:.1f}T wealth\n"
+            f"US: {self.us_adults/1e6:.0f}M adults ({self.us_population_share:.1%}), ${self.us_wealth/1e12:.1f}T wealth ({self.us_wealth_share:.0%})\n"
+            f"Bitcoin Supply: {self.bitcoin_supply/1e6:.0f}M total | US allocation: {self.us_bitcoin_share/1e6:.1f}M\n"
+            f"BTC Price (hyperbitcoinization): ${self.btc_price_global:,.0f}"
+        )
+        self._global_switch_txt = (
+            "\n✓ Switched to GLOBAL wealth distribution\n"
+            f"Population: {self.global_adults/1e9:.1f}B adults worldwide\n"
+            f"Wealth: ${self.global_wealth/1e12:.1f}T total\n"
+            "Bitcoin: Compete for full 21M BTC supply\n"
+            "Thresholds: Top 1.5%: $1M+ | Top 17.8%: $100K+ | Median: ~$25K\n"
+        )
+        self._us_switch_txt = (
+            "\n✓ Switched to US wealth distribution\n"
+            f"Population: {self.us_adults/1e6:.0f}M adults ({self.us_population_share:.1%} of global)\n"
+            f"Wealth: ${self.us_wealth/1e12:.1f}T ({self.us_wealth_share:.0%} of global)\n"
+            f"Bitcoin: Compete for {self.us_bitcoin_share/1e6:.1f}M BTC allocation\n"
+            "Thresholds: Top 1%: $11.1M+ | Top 10%: $1.2M+ | Median: $121K\n"
+        )
         
-        # State
-        self.use_global = True
-        self.current_btc_price = self.get_current_bitcoin_price()
+        # State (use_global is derived from the active mode state)
+        self._state = self._global_state
+        self._calculate_cached = functools.lru_cache(maxsize=512)(_calculate)
+        
+        # Fetch the current BTC price in the background as soon as the calculator is built
+        # (a network request unless the disk cache is fresh); current_btc_price waits for it.
+        # A daemon thread, unlike an executor worker, does not hold up interpreter exit.
+        self._current_btc_price: Optional[float] = None
+        self._price_future = concurrent.futures.Future()
+        threading.Thread(target=self._prefetch_price, daemon=True).start()
+    
+    @staticmethod
+    def _build_state(arrays: Tuple[np.ndarray, np.ndarray], btc_price: float, wealth_base: float,
+                     btc_supply: float, data_source: str, source: str,
+                     supply_label: str) -> _ModeState:
+        """Bundle one distribution's shared arrays with its price and supply constants"""
+        pcts, vals = arrays
+        return _ModeState(
+            pcts=pcts,
+            vals=vals,
+            btc_price=btc_price,
+            wealth_base=wealth_base,
+            btc_supply=btc_supply,
+            inv_btc_price=1.0 / btc_price,
+            wealth_pct_scale=100.0 / wealth_base,
+            supply_pct_scale=100.0 / btc_supply,
+            data_source=data_source,
+            source=source,
+            supply_label=supply_label
+        )
+    
+    @property
+    def use_global(self) -> bool:
+        """Whether the global (rather than US) distribution is active"""
+        return self._state is self._global_state
+    
+    @use_global.setter
+    def use_global(self, value: bool):
+        self._state = self._global_state if value else self._us_state
+    
+    @property
+    def source(self) -> str:
+        """Short name of the active distribution ('Global' or 'US')"""
+        return self._state.source
+    
+    @property
+    def current_btc_price(self) -> float:
+        """Current Bitcoin price, waiting for the background fetch on first use"""
+        if self._current_btc_price is None:
+            price, warning = self._price_future.result()
+            if warning:
+                print(warning)
+            self._current_btc_price = price
+        return self._current_btc_price
+    
+    @current_btc_price.setter
+    def current_btc_price(self, price: float):
+        self._current_btc_price = price
+    
+    def _prefetch_price(self):
+        """Resolve _price_future with the result of _fetch_bitcoin_price"""
+        try:
+            self._price_future.set_result(self._fetch_bitcoin_price())
+        except BaseException as e:
+            self._price_future.set_exception(e)
     
     def get_current_bitcoin_price(self) -> float:
-        """Fetch current Bitcoin price from CoinGecko API"""
+        """Fetch current Bitcoin price from CoinGecko API, reusing a recent cached value"""
+        price, warning = self._fetch_bitcoin_price()
+        if warning:
+            print(warning)
+        return price
+    
+    def _fetch_bitcoin_price(self) -> Tuple[float, Optional[str]]:
+        """Fetch the price without printing, returning (price, warning or None)"""
+        cached = _read_price_cache()
         try:
-            response = requests.get(
-                'https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd',
-                timeout=5
-            )
+            # A timestamp in the future (clock change, hand-edited file) is not fresh
+            if 0 <= time.time() - cached['ts'] < _PRICE_TTL:
+                return float(cached['usd']), None
+        except (KeyError, TypeError, ValueError):
+            pass
+        
+        warning = ""
+        try:
+            response = _http_session().get(_PRICE_URL, timeout=5)
             if response.status_code == 200:
-                return response.json()['bitcoin']['usd']
+                price = response.json()['bitcoin']['usd']
+                _write_price_cache(price)
+                return price, None
         except Exception as e:
-            print(f"⚠️  Error fetching Bitcoin price: {e}")
+            warning = f"⚠️  Error fetching Bitcoin price: {e}\n"
         
-        print("Using fallback Bitcoin price: $50,000")
-        return 50000.0
+        return 50000.0, warning + "Using fallback Bitcoin price: $50,000"
     
     def get_percentiles(self):
         """Get current percentile dictionary"""
@@ -73,129 +391,93 @@ class BitcoinWealthCalculator:
     
     def get_percentile_from_wealth(self, wealth: float) -> float:
         """Calculate percentile from net worth using interpolation"""
-        percentiles = self.get_percentiles()
-        pcts = list(percentiles.keys())
-        values = list(percentiles.values())
-        
-        if wealth <= values[0]:
-            return pcts[0]
-        if wealth >= values[-1]:
-            return pcts[-1]
-        
-        # Linear interpolation
-        for i in range(len(values) - 1):
-            if values[i] <= wealth <= values[i + 1]:
-                ratio = (wealth - values[i]) / (values[i + 1] - values[i])
-                return pcts[i] + ratio * (pcts[i + 1] - pcts[i])
-        
-        return 50.0
+        s = self._state
+        return _interp_point(float(wealth), s.vals, s.pcts)
     
     def get_wealth_from_percentile(self, percentile: float) -> float:
         """Calculate net worth from percentile using interpolation"""
-        percentiles = self.get_percentiles()
-        pcts = list(percentiles.keys())
-        values = list(percentiles.values())
-        
-        if percentile <= pcts[0]:
-            return values[0]
-        if percentile >= pcts[-1]:
-            return values[-1]
-        
-        # Linear interpolation
-        for i in range(len(pcts) - 1):
-            if pcts[i] <= percentile <= pcts[i + 1]:
-                ratio = (percentile - pcts[i]) / (pcts[i + 1] - pcts[i])
-                return values[i] + ratio * (values[i + 1] - values[i])
-        
-        return percentiles[50]
+        s = self._state
+        return _interp_point(float(percentile), s.pcts, s.vals)
     
-    def calculate_bitcoin_needed(self, net_worth: float) -> Dict:
+    def calculate_bitcoin_needed(self, net_worth: float) -> BitcoinResult:
         """Calculate Bitcoin needed to maintain wealth percentile"""
-        current_percentile = self.get_percentile_from_wealth(net_worth)
+        return self._calculate_cached(float(net_worth), self._state)
+    
+    def calculate_bitcoin_needed_batch(self, net_worths: np.ndarray) -> BitcoinResult:
+        """Calculate Bitcoin needed for an array of net worths in one pass"""
+        s = self._state
+        net_worths = np.atleast_1d(np.asarray(net_worths, dtype=np.float64))
+        bitcoin_needed = net_worths * s.inv_btc_price
+        # The JIT kernel only takes 1-D input; interpolate flat and restore the shape
+        percentiles = _jit_or(_interp_kernel, np.interp)(net_worths.ravel(), s.vals, s.pcts)
         
-        if self.use_global:
-            # Global mode: compete for full 21M BTC supply
-            bitcoin_needed = net_worth / self.btc_price_global
-            wealth_fraction = (net_worth / self.global_wealth) * 100
-            supply_percentage = (bitcoin_needed / self.bitcoin_supply) * 100
-            wealth_base = self.global_wealth
-            btc_supply = self.bitcoin_supply
-        else:
-            # US mode: compete for US allocation of 6.3M BTC
-            bitcoin_needed = net_worth / self.btc_price_us
-            wealth_fraction = (net_worth / self.us_wealth) * 100
-            supply_percentage = (bitcoin_needed / self.us_bitcoin_share) * 100
-            wealth_base = self.us_wealth
-            btc_supply = self.us_bitcoin_share
+        return BitcoinResult(
+            net_worth=net_worths,
+            percentile=percentiles.reshape(net_worths.shape),
+            bitcoin_needed=bitcoin_needed,
+            wealth_fraction=net_worths * s.wealth_pct_scale,
+            supply_percentage=bitcoin_needed * s.supply_pct_scale,
+            wealth_base=s.wealth_base,
+            btc_supply=s.btc_supply,
+            data_source=s.data_source
+        )
+    
+    @staticmethod
+    def format_percentage(pct: float) -> str:
+        """Format percentage with appropriate decimal places"""
+        if pct == 0:
+            # 0.0 and -0.0 compare equal and would share one cache entry
+            return _PCT_FORMATS[-1].format(pct)
+        return _format_percentage(pct)
+    
+    def _table_columns(self) -> Dict[str, list]:
+        """Build the formatted percentile table columns"""
+        s = self._state
+        wealths, bitcoin_needed, supply_percentages = _convert_numpy(
+            _TABLE_PERCENTILES, s.pcts, s.vals, s.btc_price, s.btc_supply
+        )
+        current_costs = bitcoin_needed * self.current_btc_price
         
         return {
-            'net_worth': net_worth,
-            'percentile': current_percentile,
-            'bitcoin_needed': bitcoin_needed,
-            'wealth_fraction': wealth_fraction,
-            'supply_percentage': supply_percentage,
-            'wealth_base': wealth_base,
-            'btc_supply': btc_supply,
-            'data_source': 'Global (UBS 2024)' if self.use_global else 'US (Fed SCF)'
+            f'{s.source} Percentile': list(_TABLE_LABELS),
+            'Net Worth Threshold': [f"${wealth:,.0f}" for wealth in wealths],
+            'Bitcoin Needed': [f"{btc:.8f}" for btc in bitcoin_needed],
+            'Current Cost': [f"${cost:,.2f}" for cost in current_costs],
+            s.supply_label: [self.format_percentage(float(pct)) for pct in supply_percentages]
         }
     
-    def format_percentage(self, pct: float) -> str:
-        """Format percentage with appropriate decimal places"""
-        if pct >= 1:
-            return f"{pct:.3f}%"
-        elif pct >= 0.1:
-            return f"{pct:.4f}%"
-        elif pct >= 0.01:
-            return f"{pct:.5f}%"
-        elif pct >= 0.001:
-            return f"{pct:.6f}%"
-        elif pct >= 0.0001:
-            return f"{pct:.7f}%"
-        else:
-            return f"{pct:.8f}%"
+    def format_table(self) -> str:
+        """Render the percentile table as right-aligned plain text"""
+        columns = self._table_columns()
+        cells = [[name] + values for name, values in columns.items()]
+        widths = [max(len(cell) for cell in col) for col in cells]
+        return "\n".join(
+            " ".join(col[row].rjust(width) for col, width in zip(cells, widths))
+            for row in range(len(cells[0]))
+        )
     
-    def generate_table(self) -> pd.DataFrame:
+    def generate_table(self) -> "pd.DataFrame":
         """Generate percentile table with standardized percentiles"""
-        percentiles = [1, 5, 10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 99, 99.9]
-        source = "Global" if self.use_global else "US"
+        import pandas as pd
         
-        results = []
-        for pct in percentiles:
-            wealth = self.get_wealth_from_percentile(pct)
-            calc = self.calculate_bitcoin_needed(wealth)
-            current_cost = calc['bitcoin_needed'] * self.current_btc_price
-            
-            if self.use_global:
-                supply_label = '% of Total Supply (21M)'
-            else:
-                supply_label = '% of US Allocation (6.3M)'
-            
-            results.append({
-                f'{source} Percentile': f"{pct}%",
-                'Net Worth Threshold': f"${wealth:,.0f}",
-                'Bitcoin Needed': f"{calc['bitcoin_needed']:.8f}",
-                'Current Cost': f"${current_cost:,.2f}",
-                supply_label: self.format_percentage(calc['supply_percentage'])
-            })
-        
-        return pd.DataFrame(results)
+        return pd.DataFrame(self._table_columns())
     
     def plot_distribution(self):
         """Create visualization of Bitcoin distribution"""
-        percentiles = np.linspace(1, 99.9, 50)
-        bitcoin_amounts = []
+        import matplotlib.pyplot as plt
         
-        for p in percentiles:
-            wealth = self.get_wealth_from_percentile(p)
-            result = self.calculate_bitcoin_needed(wealth)
-            bitcoin_amounts.append(result['bitcoin_needed'])
+        percentiles = _PLOT_PERCENTILES
+        s = self._state
+        _, bitcoin_amounts, _ = _convert_numpy(
+            percentiles, s.pcts, s.vals, s.btc_price, s.btc_supply
+        )
         
         plt.figure(figsize=(12, 8))
         
         # Main plot
         plt.subplot(2, 1, 1)
         plt.semilogy(percentiles, bitcoin_amounts)
-        source = "Global" if self.use_global else "US"
+        source = s.source
         plt.xlabel(f'{source} Wealth Percentile (%)')
         plt.ylabel('Bitcoin Needed (BTC)')
         plt.title(f'Bitcoin Needed to Maintain {source} Wealth Percentile')
@@ -203,8 +485,13 @@ class BitcoinWealthCalculator:
         
         # Zoomed view
         plt.subplot(2, 1, 2)
-        mask = np.array(bitcoin_amounts) <= 1
-        plt.plot(np.array(percentiles)[mask], np.array(bitcoin_amounts)[mask])
+        # Amounts grow with percentile, so the ≤1 BTC region is a prefix
+        cutoff = np.searchsorted(bitcoin_amounts, 1.0, side='right')
+        if cutoff:
+            plt.plot(percentiles[:cutoff], bitcoin_amounts[:cutoff])
+        else:
+            plt.text(0.5, 0.5, 'No percentile needs ≤1 BTC', ha='center', va='center',
+                     transform=plt.gca().transAxes)
         plt.xlabel(f'{source} Wealth Percentile (%)')
         plt.ylabel('Bitcoin Needed (BTC)')
         plt.title('Bitcoin Needed - Zoomed View (≤1 BTC)')
@@ -215,35 +502,38 @@ class BitcoinWealthCalculator:
     
     def switch_to_global(self):
         """Switch to global wealth data"""
-        self.use_global = True
-        print("\n✓ Switched to GLOBAL wealth distribution")
-        print(f"Population: {self.global_adults/1e9:.1f}B adults worldwide")
-        print(f"Wealth: ${self.global_wealth/1e12:.1f}T total")
-        print("Bitcoin: Compete for full 21M BTC supply")
-        print("Thresholds: Top 1.5%: $1M+ | Top 17.8%: $100K+ | Median: ~$25K\n")
+        self._state = self._global_state
+        print(self._global_switch_txt)
     
     def switch_to_us(self):
         """Switch to US wealth data"""
-        self.use_global = False
-        print("\n✓ Switched to US wealth distribution")
-        print(f"Population: {self.us_adults/1e6:.0f}M adults ({self.us_population_share:.1%} of global)")
-        print(f"Wealth: ${self.us_wealth/1e12:.1f}T ({self.us_wealth_share:.0%} of global)")
-        print(f"Bitcoin: Compete for {self.us_bitcoin_share/1e6:.1f}M BTC allocation")
-        print("Thresholds: Top 1%: $11.1M+ | Top 10%: $1.2M+ | Median: $121K\n")
+        self._state = self._us_state
+        print(self._us_switch_txt)
     
     def print_header(self):
         """Print calculator header"""
-        print("=== Bitcoin World Wealth Percentile Calculator ===\n")
-        print(f"Global: {self.global_adults/1e9:.1f}B adults, ${self.global_wealth/1e12:.1f}T wealth")
-        print(f"US: {self.us_adults/1e6:.0f}M adults ({self.us_population_share:.1%}), ${self.us_wealth/1e12:.1f}T wealth ({self.us_wealth_share:.0%})")
-        print(f"Bitcoin Supply: {self.bitcoin_supply/1e6:.0f}M total | US allocation: {self.us_bitcoin_share/1e6:.1f}M")
-        print(f"BTC Price (hyperbitcoinization): ${self.btc_price_global:,.0f}")
+        print(self._header_txt)
         
-        if self.current_btc_price:
+        # Show the price only if it has already arrived; the first real use waits for it
+        if self._current_btc_price is not None or self._price_future.done():
             print(f"Current BTC Price: ${self.current_btc_price:,.0f}")
         
         print("\nCommands: [number] | 'global' | 'us' | 'table' | 'plot' | 'quit'\n")
 
+def _print_table(calculator: BitcoinWealthCalculator):
+    """Print the percentile table for the active distribution"""
+    print(f"\n=== Bitcoin Requirements by {calculator.source} Percentile ===")
+    print(calculator.format_table())
+    print()
+
+# REPL commands other than 'quit', keyed by lower-cased input
+COMMANDS = {
+    'global': BitcoinWealthCalculator.switch_to_global,
+    'us': BitcoinWealthCalculator.switch_to_us,
+    'table': _print_table,
+    'plot': BitcoinWealthCalculator.plot_distribution,
+}
+
 def main():
     calculator = BitcoinWealthCalculator()
     calculator.print_header()
@@ -251,49 +541,36 @@ def main():
     while True:
         try:
             user_input = input("Input: ").strip()
+            command = user_input.lower()
             
-            if user_input.lower() == 'quit':
+            if command == 'quit':
                 print("Goodbye!")
                 break
             
-            elif user_input.lower() == 'global':
-                calculator.switch_to_global()
-            
-            elif user_input.lower() == 'us':
-                calculator.switch_to_us()
-            
-            elif user_input.lower() == 'table':
-                source = "Global" if calculator.use_global else "US"
-                print(f"\n=== Bitcoin Requirements by {source} Percentile ===")
-                table = calculator.generate_table()
-                print(table.to_string(index=False))
-                print()
-            
-            elif user_input.lower() == 'plot':
-                calculator.plot_distribution()
+            elif command in COMMANDS:
+                COMMANDS[command](calculator)
             
             else:
                 # Parse net worth
-                net_worth = float(user_input.replace('$', '').replace(',', ''))
+                net_worth = float(user_input.translate(_STRIP))
                 result = calculator.calculate_bitcoin_needed(net_worth)
                 
                 # Calculate current cost
-                current_cost = result['bitcoin_needed'] * calculator.current_btc_price
+                current_cost = result.bitcoin_needed * calculator.current_btc_price
                 
-                source = "Global" if calculator.use_global else "US"
-                print(f"\n=== Results for ${net_worth:,.0f} ({result['data_source']}) ===")
-                print(f"{source} percentile: {result['percentile']:.2f}%")
-                print(f"Bitcoin needed: {result['bitcoin_needed']:.8f} BTC")
+                print(f"\n=== Results for ${net_worth:,.0f} ({result.data_source}) ===")
+                print(f"{calculator.source} percentile: {result.percentile:.2f}%")
+                print(f"Bitcoin needed: {result.bitcoin_needed:.8f} BTC")
                 print(f"Current cost: ${current_cost:,.2f}")
                 
                 if calculator.use_global:
-                    print(f"% of total supply (21M): {calculator.format_percentage(result['supply_percentage'])}")
-                    print(f"% of global wealth: {result['wealth_fraction']:.8f}%")
+                    print(f"% of total supply (21M): {calculator.format_percentage(result.supply_percentage)}")
+                    print(f"% of global wealth: {result.wealth_fraction:.8f}%")
                 else:
-                    print(f"% of US allocation (6.3M): {calculator.format_percentage(result['supply_percentage'])}")
-                    print(f"% of total supply (21M): {calculator.format_percentage((result['bitcoin_needed']/calculator.bitcoin_supply)*100)}")
-                    print(f"% of US wealth: {result['wealth_fraction']:.8f}%")
-                    print(f"% of global wealth: {((result['bitcoin_needed']*calculator.btc_price_global)/calculator.global_wealth)*100:.8f}%")
+                    print(f"% of US allocation (6.3M): {calculator.format_percentage(result.supply_percentage)}")
+                    print(f"% of total supply (21M): {calculator.format_percentage((result.bitcoin_needed/calculator.bitcoin_supply)*100)}")
+                    print(f"% of US wealth: {result.wealth_fraction:.8f}%")
+                    print(f"% of global wealth: {((result.bitcoin_needed*calculator.btc_price_global)/calculator.global_wealth)*100:.8f}%")
                 print()
         
         except ValueError:
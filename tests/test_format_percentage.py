@@ -0,0 +1,65 @@
+"""Regression tests for the log10-based format_percentage"""
+
+import math
+import unittest
+
+import numpy as np
+
+from bitcoin_calculator import BitcoinWealthCalculator, _format_percentage
+
+
+def ladder_format_percentage(pct: float) -> str:
+    """The original if/elif ladder that format_percentage replaced"""
+    if pct >= 1:
+        return f"{pct:.3f}%"
+    elif pct >= 0.1:
+        return f"{pct:.4f}%"
+    elif pct >= 0.01:
+        return f"{pct:.5f}%"
+    elif pct >= 0.001:
+        return f"{pct:.6f}%"
+    elif pct >= 0.0001:
+        return f"{pct:.7f}%"
+    else:
+        return f"{pct:.8f}%"
+
+
+def ulp_neighbours(x: float, n: int = 4):
+    """x and the n representable floats on either side of it"""
+    below, above = [x], [x]
+    for _ in range(n):
+        below.append(math.nextafter(below[-1], -math.inf))
+        above.append(math.nextafter(above[-1], math.inf))
+    return below[:0:-1] + above
+
+
+class FormatPercentageTest(unittest.TestCase):
+    def setUp(self):
+        _format_percentage.cache_clear()
+
+    def assertMatchesLadder(self, values):
+        for pct in values:
+            with self.subTest(pct=pct):
+                self.assertEqual(BitcoinWealthCalculator.format_percentage(pct),
+                                 ladder_format_percentage(pct))
+
+    def test_threshold_boundaries(self):
+        for threshold in (1, 0.1, 0.01, 0.001, 0.0001):
+            self.assertMatchesLadder(ulp_neighbours(threshold))
+
+    def test_zero_and_negative(self):
+        self.assertMatchesLadder([0, 0.0, -0.0, 0.0, -1e-12, -0.0001, -0.5, -1, -250.0])
+
+    def test_non_finite(self):
+        self.assertMatchesLadder([math.nan, math.inf, -math.inf])
+
+    def test_powers_of_ten(self):
+        self.assertMatchesLadder([10.0 ** e for e in range(-12, 4)])
+
+    def test_random_magnitudes(self):
+        rng = np.random.default_rng(0)
+        self.assertMatchesLadder(10.0 ** rng.uniform(-10, 3, 5000))
+
+
+if __name__ == '__main__':
+    unittest.main()